@@ -258,6 +258,7 @@ class AsyncOperation:
         self.mimetype = mimetype
         self.operation_id = operation_id
         self.pythonic_params = pythonic_params
+        self._decorated_fn: t.Optional[t.Callable] = None
 
     @classmethod
     def from_operation(
@@ -276,18 +277,21 @@ class AsyncOperation:
 
     @property
     def fn(self) -> t.Callable:
-        fn = parameter_to_arg(self._operation, self._fn, self.pythonic_params)
-        return RequestResponseDecorator(self.api, self.mimetype)(
-            fn, uri_parser=self.uri_parser
-        )
+        if self._decorated_fn is None:
+            fn = parameter_to_arg(self._operation, self._fn, self.pythonic_params)
+            self._decorated_fn = RequestResponseDecorator(self.api, self.mimetype)(
+                fn, uri_parser=self.uri_parser
+            )
+        return self._decorated_fn
 
     async def __call__(
         self, scope: Scope, receive: Receive, send: Send
     ) -> StarletteResponse:
-        if asyncio.iscoroutinefunction(self.fn):
-            return await self.fn(scope=scope, receive=receive, send=send)
+        fn = self.fn
+        if asyncio.iscoroutinefunction(fn):
+            return await fn(scope=scope, receive=receive, send=send)
         else:
-            return self.fn(scope=scope, receive=receive, send=send)
+            return fn(scope=scope, receive=receive, send=send)
 
 
 class MissingAsyncOperation(ProblemException):
@@ -5,15 +5,22 @@ import asyncio
 import builtins
 import functools
 import inspect
+import json
 import keyword
 import logging
 import re
 import typing as t
+import weakref
 from copy import copy, deepcopy
 
 import inflection
 
-from connexion.http_facts import FORM_CONTENT_TYPES
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore  # pragma: no cover
+
+from connexion.http_facts import BODY_METHODS, FORM_CONTENT_TYPES
 from connexion.lifecycle import ConnexionRequest, MiddlewareRequest
 from connexion.operations import AbstractOperation, Swagger2Operation
 from connexion.utils import (
@@ -28,6 +35,55 @@ logger = logging.getLogger(__name__)
 
 CONTEXT_NAME = "context_"
 
+# Cache of inspected function signatures, keyed by the function object so entries are released
+# together with the function.
+_SIG_CACHE: "weakref.WeakKeyDictionary[t.Callable, t.Tuple[t.FrozenSet[str], bool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_RE_BRACKET = re.compile(r"\[(?!])")
+_RE_NONALNUM = re.compile(r"[^0-9a-zA-Z_]")
+_RE_LEAD = re.compile(r"^[^a-zA-Z_]+")
+_TRANSLATE = str.maketrans({"[": "_"})
+
+# Map every digit to "0" so runs of digits can be found with a plain substring search. Any
+# integer outside of the signed 64 bit range has at least 19 digits.
+_DIGITS_TO_ZERO = bytes(48 if 48 <= c <= 57 else c for c in range(256))
+_LONG_DIGITS = b"0" * 19
+
+# Names which would shadow a built-in or are reserved, and get an underscore appended
+_BUILTIN_NAMES = frozenset(builtins.__dict__) | frozenset(keyword.kwlist)
+
+# Default values of these types can be shared between requests without copying
+_IMMUTABLE_TYPES = (int, float, str, bool, type(None), tuple, frozenset)
+
+
+class _ParamType(t.NamedTuple):
+    """Whether a parameter is nullable and an array, and the function which casts its value,
+    or each of its items for an array. Values of untyped parameters are passed through
+    without a caster."""
+
+    nullable: bool
+    is_array: bool
+    caster: t.Optional[t.Callable[[t.Any], t.Any]]
+
+
+class _JsonSchema(t.NamedTuple):
+    """Whether a json body schema is nullable, and its default body."""
+
+    nullable: bool
+    default_body: t.Any
+
+
+class _FormSchema(t.NamedTuple):
+    """The default body of a form body schema and its mutable keys, the types of its
+    properties, and whether additional properties are allowed, or their type."""
+
+    default_body: dict
+    mutable_defaults: t.Tuple[str, ...]
+    body_types: t.Dict[str, _ParamType]
+    additional_type: t.Union[_ParamType, bool]
+
 
 def parameter_to_arg(
     operation: AbstractOperation,
@@ -38,6 +94,30 @@ def parameter_to_arg(
     sanitize = pythonic if pythonic_params else sanitized
     arguments, has_kwargs = inspect_function_arguments(function)
 
+    has_body = operation.method.lower() in BODY_METHODS
+    get_arguments = make_arguments_getter(
+        operation,
+        arguments=arguments,
+        has_kwargs=has_kwargs,
+        sanitize=sanitize,
+        has_body=has_body,
+    )
+
+    # The body is only passed to handlers of methods with a body, which take arguments
+    reads_body = has_body and (bool(arguments) or has_kwargs)
+    is_swagger2 = isinstance(operation, Swagger2Operation)
+
+    @functools.lru_cache(maxsize=32)
+    def get_body_name(content_type: str) -> str:
+        return sanitize(operation.body_name(content_type))
+
+    _prep_kwargs = functools.partial(
+        prep_kwargs,
+        get_arguments=get_arguments,
+        arguments=arguments,
+        has_kwargs=has_kwargs,
+    )
+
     # TODO: should always be used for AsyncApp
     if asyncio.iscoroutinefunction(function):
 
@@ -45,13 +125,13 @@ def parameter_to_arg(
         async def wrapper(
             request: t.Union[ConnexionRequest, MiddlewareRequest]
         ) -> t.Any:
-            body_name = sanitize(operation.body_name(request.content_type))
+            body_name = get_body_name(request.content_type)
             # Pass form contents separately for Swagger2 for backward compatibility with
             # Connexion 2 Checking for body_name is not enough
             request_body = None
-            if (body_name in arguments or has_kwargs) or (
-                request.mimetype in FORM_CONTENT_TYPES
-                and isinstance(operation, Swagger2Operation)
+            if reads_body and (
+                (body_name in arguments or has_kwargs)
+                or (is_swagger2 and request.mimetype in FORM_CONTENT_TYPES)
             ):
 
                 if isinstance(request, ConnexionRequest):
@@ -59,13 +139,8 @@ def parameter_to_arg(
                 elif isinstance(request, MiddlewareRequest):
                     request_body = await get_starlette_body(request)
 
-            kwargs = prep_kwargs(
-                request,
-                operation=operation,
-                request_body=request_body,
-                arguments=arguments,
-                has_kwargs=has_kwargs,
-                sanitize=sanitize,
+            kwargs = _prep_kwargs(
+                request, request_body=request_body, body_name=body_name
             )
 
             return await function(**kwargs)
@@ -74,24 +149,19 @@ def parameter_to_arg(
 
         @functools.wraps(function)
         def wrapper(request: ConnexionRequest) -> t.Any:
-            body_name = sanitize(operation.body_name(request.content_type))
+            body_name = get_body_name(request.content_type)
             # Pass form contents separately for Swagger2 for backward compatibility with
             # Connexion 2 Checking for body_name is not enough
-            if (body_name in arguments or has_kwargs) or (
-                request.mimetype in FORM_CONTENT_TYPES
-                and isinstance(operation, Swagger2Operation)
+            if reads_body and (
+                (body_name in arguments or has_kwargs)
+                or (is_swagger2 and request.mimetype in FORM_CONTENT_TYPES)
             ):
                 request_body = get_flask_body(request)
             else:
                 request_body = None
 
-            kwargs = prep_kwargs(
-                request,
-                operation=operation,
-                request_body=request_body,
-                arguments=arguments,
-                has_kwargs=has_kwargs,
-                sanitize=sanitize,
+            kwargs = _prep_kwargs(
+                request, request_body=request_body, body_name=body_name
             )
 
             return function(**kwargs)
@@ -99,9 +169,25 @@ def parameter_to_arg(
     return wrapper
 
 
+def _json_loads(data: bytes) -> t.Any:
+    """Deserialize a JSON body, using orjson if it is installed.
+
+    orjson converts integers above 64 bits to floats, so documents which might contain one are
+    left to the standard library, as are documents orjson rejects but the standard library
+    accepts.
+    """
+    if orjson is not None and _LONG_DIGITS not in data.translate(_DIGITS_TO_ZERO):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def get_flask_body(request: ConnexionRequest) -> t.Any:
     """Get body from a sync request based on the content type."""
     if is_json_mimetype(request.content_type):
+        # Use Flask's JSON provider, which the application might have customized
         return request.get_json(silent=True)
     elif request.mimetype in FORM_CONTENT_TYPES:
         return request.form
@@ -113,7 +199,10 @@ def get_flask_body(request: ConnexionRequest) -> t.Any:
 async def get_starlette_body(request: MiddlewareRequest) -> t.Any:
     """Get body from an async request based on the content type."""
     if is_json_mimetype(request.content_type):
-        return await request.json()
+        data = await request.body()
+        # Return explicit None instead of failing on an empty body, like get_json does for
+        # sync requests
+        return _json_loads(data) if data else None
     elif request.mimetype in FORM_CONTENT_TYPES:
         return await request.form()
     else:
@@ -124,27 +213,21 @@ async def get_starlette_body(request: MiddlewareRequest) -> t.Any:
 def prep_kwargs(
     request: t.Union[ConnexionRequest, MiddlewareRequest],
     *,
-    operation: AbstractOperation,
     request_body: t.Any,
-    arguments: t.List[str],
+    body_name: str,
+    get_arguments: t.Callable[..., t.Dict[str, t.Any]],
+    arguments: t.FrozenSet[str],
     has_kwargs: bool,
-    sanitize: t.Callable,
 ) -> dict:
     kwargs = get_arguments(
-        operation,
         path_params=request.path_params,
         query_params=request.query_params,
         body=request_body,
         files=request.files,
-        arguments=arguments,
-        has_kwargs=has_kwargs,
-        sanitize=sanitize,
         content_type=request.content_type,
+        body_name=body_name,
     )
 
-    # optionally convert parameter variable names to un-shadowed, snake_case form
-    kwargs = {sanitize(k): v for k, v in kwargs.items()}
-
     # add context info (e.g. from security decorator)
     for key, value in request.context.items():
         if has_kwargs or key in arguments:
@@ -158,21 +241,36 @@ def prep_kwargs(
     return kwargs
 
 
-def inspect_function_arguments(function: t.Callable) -> t.Tuple[t.List[str], bool]:
+def inspect_function_arguments(
+    function: t.Callable,
+) -> t.Tuple[t.FrozenSet[str], bool]:
     """
-    Returns the list of variables names of a function and if it
+    Returns the set of variables names of a function and if it
     accepts keyword arguments.
     """
+    try:
+        return _SIG_CACHE[function]
+    except (KeyError, TypeError):
+        pass
+
     parameters = inspect.signature(function).parameters
-    bound_arguments = [
+    bound_arguments = frozenset(
         name
         for name, p in parameters.items()
         if p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
-    ]
+    )
     has_kwargs = any(p.kind == p.VAR_KEYWORD for p in parameters.values())
-    return list(bound_arguments), has_kwargs
+    result = bound_arguments, has_kwargs
+
+    try:
+        _SIG_CACHE[function] = result
+    except TypeError:
+        # Callable does not support weak references
+        pass
+    return result
 
 
+@functools.lru_cache(maxsize=2048)
 def snake_and_shadow(name: str) -> str:
     """
     Converts the given name into Pythonic form. Firstly it converts CamelCase names to snake_case. Secondly it looks to
@@ -180,127 +278,215 @@ def snake_and_shadow(name: str) -> str:
     :param name: The parameter name
     """
     snake = inflection.underscore(name)
-    if snake in builtins.__dict__ or keyword.iskeyword(snake):
+    if snake in _BUILTIN_NAMES:
         return f"{snake}_"
     return snake
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitized(name: str) -> str:
-    return name and re.sub(
-        "^[^a-zA-Z_]+", "", re.sub("[^0-9a-zA-Z_]", "", re.sub(r"\[(?!])", "_", name))
-    )
+    if not name:
+        return name
+    if "[]" in name:
+        name = _RE_BRACKET.sub("_", name)
+    else:
+        name = name.translate(_TRANSLATE)
+    return _RE_LEAD.sub("", _RE_NONALNUM.sub("", name))
 
 
+@functools.lru_cache(maxsize=4096)
 def pythonic(name: str) -> str:
     name = name and snake_and_shadow(name)
     return sanitized(name)
 
 
-def get_arguments(
+def make_arguments_getter(
     operation: AbstractOperation,
     *,
-    path_params: dict,
-    query_params: dict,
-    body: t.Any,
-    files: dict,
-    arguments: t.List[str],
+    arguments: t.FrozenSet[str],
     has_kwargs: bool,
     sanitize: t.Callable,
-    content_type: str,
-) -> t.Dict[str, t.Any]:
+    has_body: bool,
+) -> t.Callable[..., t.Dict[str, t.Any]]:
     """
-    get arguments for handler function
+    Build the function which gets the arguments for the handler function of the operation.
+
+    Everything which only depends on the specification is resolved here, so the returned
+    function only handles the request data.
     """
-    ret = {}
-    ret.update(_get_path_arguments(path_params, operation=operation, sanitize=sanitize))
-    ret.update(
-        _get_query_arguments(
-            query_params,
-            operation=operation,
-            arguments=arguments,
-            has_kwargs=has_kwargs,
-            sanitize=sanitize,
-        )
+    path_definitions = _get_param_definitions(operation, "path")
+    query_definitions = _get_param_definitions(operation, "query")
+    path_types = _get_param_types(path_definitions)
+    query_types = _get_param_types(query_definitions)
+    default_query_params = _get_query_defaults(query_definitions)
+    mutable_query_defaults = _get_mutable_keys(default_query_params)
+    # Content types come from the request, so the cache is bounded
+    get_form_schema = functools.lru_cache(maxsize=32)(
+        functools.partial(_get_form_schema, operation)
+    )
+    get_json_schema = functools.lru_cache(maxsize=32)(
+        functools.partial(_get_json_schema, operation)
     )
 
-    if operation.method.upper() in ["PATCH", "POST", "PUT"]:
+    def get_query_and_path_arguments(
+        path_params: dict, query_params: dict
+    ) -> t.Dict[str, t.Any]:
+        ret = _get_path_arguments(path_params, path_types=path_types, sanitize=sanitize)
         ret.update(
-            _get_body_argument(
-                body,
-                operation=operation,
+            _get_query_arguments(
+                query_params,
+                query_definitions=query_definitions,
+                query_types=query_types,
+                default_query_params=default_query_params,
+                mutable_query_defaults=mutable_query_defaults,
                 arguments=arguments,
                 has_kwargs=has_kwargs,
                 sanitize=sanitize,
-                content_type=content_type,
             )
         )
-        ret.update(_get_file_arguments(files, arguments, has_kwargs))
-    return ret
+        return ret
+
+    if not has_body:
+
+        def get_arguments(
+            *,
+            path_params: dict,
+            query_params: dict,
+            body: t.Any,
+            files: dict,
+            content_type: str,
+            body_name: str,
+        ) -> t.Dict[str, t.Any]:
+            """
+            get arguments for handler function
+            """
+            return get_query_and_path_arguments(path_params, query_params)
+
+    else:
+
+        def get_arguments(
+            *,
+            path_params: dict,
+            query_params: dict,
+            body: t.Any,
+            files: dict,
+            content_type: str,
+            body_name: str,
+        ) -> t.Dict[str, t.Any]:
+            """
+            get arguments for handler function
+            """
+            ret = get_query_and_path_arguments(path_params, query_params)
+            ret.update(
+                _get_body_argument(
+                    body,
+                    operation=operation,
+                    arguments=arguments,
+                    has_kwargs=has_kwargs,
+                    sanitize=sanitize,
+                    content_type=content_type,
+                    body_name=body_name,
+                    get_form_schema=get_form_schema,
+                    get_json_schema=get_json_schema,
+                )
+            )
+            ret.update(_get_file_arguments(files, arguments, has_kwargs, sanitize))
+            return ret
+
+    return get_arguments
+
+
+def _get_param_definitions(
+    operation: AbstractOperation, location: str
+) -> t.Dict[str, dict]:
+    """Get the parameter definitions of the operation for the given location, by name."""
+    return {
+        parameter["name"]: parameter
+        for parameter in operation.parameters
+        if parameter["in"] == location
+    }
 
 
 def _get_path_arguments(
-    path_params: dict, *, operation: AbstractOperation, sanitize: t.Callable
+    path_params: dict, *, path_types: t.Dict[str, _ParamType], sanitize: t.Callable
 ) -> dict:
     """
     Extract handler function arguments from path parameters
     """
     kwargs = {}
 
-    path_definitions = {
-        parameter["name"]: parameter
-        for parameter in operation.parameters
-        if parameter["in"] == "path"
-    }
-
     for name, value in path_params.items():
         sanitized_key = sanitize(name)
-        if name in path_definitions:
-            kwargs[sanitized_key] = _get_val_from_param(value, path_definitions[name])
+        if name in path_types:
+            kwargs[sanitized_key] = _cast_param(value, path_types[name])
         else:  # Assume path params mechanism used for injection
             kwargs[sanitized_key] = value
     return kwargs
 
 
-def _get_val_from_param(value: t.Any, param_definitions: t.Dict[str, dict]) -> t.Any:
-    """Cast a value according to its definition in the specification."""
-    param_schema = param_definitions.get("schema", param_definitions)
+def _get_param_type(param_definition: dict) -> _ParamType:
+    """Get the type of a parameter from its definition."""
+    param_schema = param_definition.get("schema", param_definition)
+    nullable = bool(is_nullable(param_schema))
+
+    is_array = param_schema.get("type") == "array"
+    if is_array:
+        param_schema = param_schema.get("items", {})
+
+    type_ = param_schema.get("type")
+    if type_ is None:
+        return _ParamType(nullable, is_array, None)
+    caster = functools.partial(
+        make_type, type_=type_, format_=param_schema.get("format")
+    )
+    return _ParamType(nullable, is_array, caster)
+
+
+def _get_param_types(param_definitions: t.Dict[str, dict]) -> t.Dict[str, _ParamType]:
+    """Get the parameter types of the given parameter definitions, by name."""
+    return {
+        name: _get_param_type(definition)
+        for name, definition in param_definitions.items()
+    }
 
-    if is_nullable(param_schema) and is_null(value):
+
+def _cast_param(value: t.Any, param_type: _ParamType) -> t.Any:
+    """Cast a value according to its precomputed parameter type."""
+    nullable, is_array, caster = param_type
+
+    if nullable and is_null(value):
         return None
 
-    if param_schema["type"] == "array":
-        type_ = param_schema["items"]["type"]
-        format_ = param_schema["items"].get("format")
-        return [make_type(part, type_, format_) for part in value]
-    else:
-        type_ = param_schema["type"]
-        format_ = param_schema.get("format")
-        return make_type(value, type_, format_)
+    if caster is None:
+        return value
+    if is_array:
+        return list(map(caster, value))
+    return caster(value)
 
 
 def _get_query_arguments(
     query_params: dict,
     *,
-    operation: AbstractOperation,
-    arguments: t.List[str],
+    query_definitions: t.Dict[str, dict],
+    query_types: t.Dict[str, _ParamType],
+    default_query_params: t.Dict[str, t.Any],
+    mutable_query_defaults: t.Tuple[str, ...],
+    arguments: t.FrozenSet[str],
     has_kwargs: bool,
     sanitize: t.Callable,
 ) -> dict:
     """
     extract handler function arguments from the query parameters
     """
-    query_definitions = {
-        parameter["name"]: parameter
-        for parameter in operation.parameters
-        if parameter["in"] == "query"
-    }
-
-    default_query_params = _get_query_defaults(query_definitions)
-
-    query_arguments = deepcopy(default_query_params)
+    query_arguments = _copy_defaults(default_query_params, mutable_query_defaults)
     query_arguments = deep_merge(query_arguments, query_params)
     return _query_args_helper(
-        query_definitions, query_arguments, arguments, has_kwargs, sanitize
+        query_definitions,
+        query_types,
+        query_arguments,
+        arguments,
+        has_kwargs,
+        sanitize,
     )
 
 
@@ -320,6 +506,21 @@ def _get_query_defaults(query_definitions: t.Dict[str, dict]) -> t.Dict[str, t.A
     return defaults
 
 
+def _get_mutable_keys(defaults: t.Dict[str, t.Any]) -> t.Tuple[str, ...]:
+    """Get the keys of the default values which need to be deep copied before use."""
+    return tuple(k for k, v in defaults.items() if not isinstance(v, _IMMUTABLE_TYPES))
+
+
+def _copy_defaults(
+    defaults: t.Dict[str, t.Any], mutable_keys: t.Iterable[str]
+) -> t.Dict[str, t.Any]:
+    """Copy the default values, only deep copying the ones which can be mutated."""
+    copied = defaults.copy()
+    for key in mutable_keys:
+        copied[key] = deepcopy(defaults[key])
+    return copied
+
+
 def _get_default_obj(schema: dict) -> dict:
     try:
         return deepcopy(schema["default"])
@@ -343,8 +544,9 @@ def _build_default_obj_recursive(properties: dict, default_object: dict) -> dict
 
 def _query_args_helper(
     query_definitions: dict,
+    query_types: t.Dict[str, _ParamType],
     query_arguments: dict,
-    function_arguments: t.List[str],
+    function_arguments: t.FrozenSet[str],
     has_kwargs: bool,
     sanitize: t.Callable,
 ) -> dict:
@@ -373,7 +575,7 @@ def _query_args_helper(
                 )
             else:
                 logger.debug("%s is a %s", key, query_defn)
-                result.update({sanitized_key: _get_val_from_param(value, query_defn)})
+                result.update({sanitized_key: _cast_param(value, query_types[key])})
     return result
 
 
@@ -381,36 +583,34 @@ def _get_body_argument(
     body: t.Any,
     *,
     operation: AbstractOperation,
-    arguments: t.List[str],
+    arguments: t.FrozenSet[str],
     has_kwargs: bool,
     sanitize: t.Callable,
     content_type: str,
+    body_name: str,
+    get_form_schema: t.Callable[[str], _FormSchema],
+    get_json_schema: t.Callable[[str], _JsonSchema],
 ) -> dict:
     if len(arguments) <= 0 and not has_kwargs:
         return {}
 
-    body_name = sanitize(operation.body_name(content_type))
-
     if content_type in FORM_CONTENT_TYPES:
         result = _get_body_argument_form(
-            body, operation=operation, content_type=content_type
+            body, form_schema=get_form_schema(content_type)
         )
 
         # Unpack form values for Swagger for compatibility with Connexion 2 behavior
         if content_type in FORM_CONTENT_TYPES and isinstance(
             operation, Swagger2Operation
         ):
-            if has_kwargs:
-                return result
-            else:
-                return {
-                    sanitize(name): value
-                    for name, value in result.items()
-                    if sanitize(name) in arguments
-                }
+            return {
+                sanitize(name): value
+                for name, value in result.items()
+                if has_kwargs or sanitize(name) in arguments
+            }
     else:
         result = _get_body_argument_json(
-            body, operation=operation, content_type=content_type
+            body, json_schema=get_json_schema(content_type)
         )
 
     if body_name in arguments or has_kwargs:
@@ -419,74 +619,107 @@ def _get_body_argument(
     return {}
 
 
-def _get_body_argument_json(
-    body: t.Any, *, operation: AbstractOperation, content_type: str
-) -> t.Any:
+def _get_json_schema(operation: AbstractOperation, content_type: str) -> _JsonSchema:
+    """Get whether the json body schema is nullable and its default body."""
+    body_schema = operation.body_schema(content_type)
+    return _JsonSchema(is_nullable(body_schema), body_schema.get("default", {}))
+
+
+def _get_body_argument_json(body: t.Any, *, json_schema: _JsonSchema) -> t.Any:
+    nullable, default_body = json_schema
+
     # if the body came in null, and the schema says it can be null, we decide
     # to include no value for the body argument, rather than the default body
-    if is_nullable(operation.body_schema(content_type)) and is_null(body):
+    if nullable and is_null(body):
         return None
 
     if body is None:
-        default_body = operation.body_schema(content_type).get("default", {})
+        if isinstance(default_body, _IMMUTABLE_TYPES):
+            return default_body
         return deepcopy(default_body)
 
     return body
 
 
-def _get_body_argument_form(
-    body: dict, *, operation: AbstractOperation, content_type: str
-) -> dict:
-    # now determine the actual value for the body (whether it came in or is default)
-    default_body = operation.body_schema(content_type).get("default", {})
-    body_props = {
-        k: {"schema": v}
-        for k, v in operation.body_schema(content_type).get("properties", {}).items()
+def _get_form_schema(operation: AbstractOperation, content_type: str) -> _FormSchema:
+    """Get the default body, its mutable keys, the types of the properties and whether
+    additional properties are allowed, or their type, of the form body schema."""
+    body_schema = operation.body_schema(content_type)
+    default_body = body_schema.get("default", {})
+    body_types = {
+        k: _get_param_type({"schema": v})
+        for k, v in body_schema.get("properties", {}).items()
     }
 
     # by OpenAPI specification `additionalProperties` defaults to `true`
     # see: https://github.com/OAI/OpenAPI-Specification/blame/3.0.2/versions/3.0.2.md#L2305
     additional_props = operation.body_schema().get("additionalProperties", True)
+    additional_type: t.Union[_ParamType, bool]
+    if isinstance(additional_props, dict) and additional_props:
+        additional_type = _get_param_type({"schema": additional_props})
+    else:
+        additional_type = bool(additional_props)
 
-    body_arg = deepcopy(default_body)
-    body_arg.update(body or {})
+    return _FormSchema(
+        default_body, _get_mutable_keys(default_body), body_types, additional_type
+    )
 
-    if body_props or additional_props:
-        return _get_typed_body_values(body_arg, body_props, additional_props)
 
-    return {}
+def _get_body_argument_form(
+    body: dict,
+    *,
+    form_schema: _FormSchema,
+) -> dict:
+    default_body, mutable_defaults, body_types, additional_type = form_schema
 
+    if not (body_types or additional_type):
+        return {}
 
-def _get_typed_body_values(body_arg, body_props, additional_props):
+    # now determine the actual value for the body (whether it came in or is default). The
+    # body is only read, so it doesn't need to be copied if none of the defaults are used.
+    if not default_body:
+        body_arg = body or {}
+    elif body and body.keys() >= default_body.keys():
+        body_arg = body
+    else:
+        body_arg = _copy_defaults(default_body, mutable_defaults)
+        body_arg.update(body or {})
+
+    return _get_typed_body_values(body_arg, body_types, additional_type)
+
+
+def _get_typed_body_values(body_arg, body_types, additional_type):
     """
     Return a copy of the provided body_arg dictionary
     whose values will have the appropriate types
-    as defined in the provided schemas.
+    as precomputed from the body schema.
 
     :type body_arg: type dict
-    :type body_props: dict
-    :type additional_props: dict|bool
+    :type body_types: dict
+    :type additional_type: _ParamType|bool
     :rtype: dict
     """
-    additional_props_defn = (
-        {"schema": additional_props} if isinstance(additional_props, dict) else None
-    )
     res = {}
 
     for key, value in body_arg.items():
         try:
-            prop_defn = body_props[key]
-            res[key] = _get_val_from_param(value, prop_defn)
-        except KeyError:  # pragma: no cover
-            if not additional_props:
+            param_type = body_types[key]
+        except KeyError:
+            if not additional_type:
                 logger.error(f"Body property '{key}' not defined in body schema")
                 continue
-            if additional_props_defn is not None:
-                value = _get_val_from_param(value, additional_props_defn)
+            if additional_type is not True:
+                value = _cast_param(value, additional_type)
             res[key] = value
+        else:
+            res[key] = _cast_param(value, param_type)
 
     return res
 
 
-def _get_file_arguments(files, arguments, has_kwargs=False):
-    return {k: v for k, v in files.items() if k in arguments or has_kwargs}
+def _get_file_arguments(files, arguments, has_kwargs=False, sanitize=sanitized):
+    return {
+        sanitize(k): v
+        for k, v in files.items()
+        if has_kwargs or sanitize(k) in arguments
+    }
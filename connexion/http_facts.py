@@ -5,3 +5,6 @@ This module contains definitions of the HTTP protocol.
 FORM_CONTENT_TYPES = ["application/x-www-form-urlencoded", "multipart/form-data"]
 
 METHODS = {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+
+# Methods for which a request body is passed to the view function
+BODY_METHODS = frozenset({"patch", "post", "put"})
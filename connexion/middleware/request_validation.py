@@ -28,8 +28,30 @@ class RequestValidationOperation:
         self.next_app = next_app
         self._operation = operation
         self.strict_validation = strict_validation
-        self._validator_map = VALIDATOR_MAP.copy()
-        self._validator_map.update(validator_map or {})
+        # The default map is only read, so it can be shared between operations
+        if validator_map:
+            self._validator_map = {**VALIDATOR_MAP, **validator_map}
+        else:
+            self._validator_map = VALIDATOR_MAP
+        # Convert to MediaTypeDict to handle media-ranges
+        self._consumes_media_type_dict = MediaTypeDict(
+            [(c.lower(), None) for c in operation.consumes]
+        )
+        # Parameter validation and uri parsing only depend on the specification, and the
+        # instances don't keep request state
+        self._uri_parser = operation._uri_parser_class(
+            operation.parameters, operation.body_definition()
+        )
+        parameter_validator_cls = self._validator_map["parameter"]
+        self._parameter_validator = parameter_validator_cls(  # type: ignore
+            operation.parameters,
+            uri_parser=self._uri_parser,
+            strict_validation=strict_validation,
+        )
+        self._body_nullable_by_mime = {
+            mime_type: utils.is_nullable(operation.body_definition(mime_type))
+            for mime_type in operation.consumes
+        }
 
     def extract_content_type(
         self, headers: t.List[t.Tuple[bytes, bytes]]
@@ -57,31 +79,24 @@ class RequestValidationOperation:
 
         :param mime_type: mime type from content type header
         """
-        # Convert to MediaTypeDict to handle media-ranges
-        media_type_dict = MediaTypeDict(
-            [(c.lower(), None) for c in self._operation.consumes]
-        )
-        if mime_type.lower() not in media_type_dict:
+        if mime_type.lower() not in self._consumes_media_type_dict:
             raise UnsupportedMediaTypeProblem(
                 detail=f"Invalid Content-type ({mime_type}), "
                 f"expected {self._operation.consumes}"
             )
 
+    def _is_body_nullable(self, mime_type: str) -> bool:
+        try:
+            return self._body_nullable_by_mime[mime_type]
+        except KeyError:
+            # Mime type matched a media range of the spec
+            return utils.is_nullable(self._operation.body_definition(mime_type))
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         receive_fn = receive
 
         # Validate parameters & headers
-        uri_parser_class = self._operation._uri_parser_class
-        uri_parser = uri_parser_class(
-            self._operation.parameters, self._operation.body_definition()
-        )
-        parameter_validator_cls = self._validator_map["parameter"]
-        parameter_validator = parameter_validator_cls(  # type: ignore
-            self._operation.parameters,
-            uri_parser=uri_parser,
-            strict_validation=self.strict_validation,
-        )
-        parameter_validator.validate(scope)
+        self._parameter_validator.validate(scope)
 
         # Extract content type
         headers = scope["headers"]
@@ -103,12 +118,10 @@ class RequestValidationOperation:
                     scope,
                     receive,
                     schema=schema,
-                    nullable=utils.is_nullable(
-                        self._operation.body_definition(mime_type)
-                    ),
+                    nullable=self._is_body_nullable(mime_type),
                     encoding=encoding,
                     strict_validation=self.strict_validation,
-                    uri_parser=self._operation._uri_parsing_decorator,
+                    uri_parser=self._uri_parser,
                 )
                 receive_fn = await validator.wrapped_receive()
 
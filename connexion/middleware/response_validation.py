@@ -25,8 +25,11 @@ class ResponseValidationOperation:
     ) -> None:
         self.next_app = next_app
         self._operation = operation
-        self._validator_map = VALIDATOR_MAP.copy()
-        self._validator_map.update(validator_map or {})
+        # The default map is only read, so it can be shared between operations
+        if validator_map:
+            self._validator_map = {**VALIDATOR_MAP, **validator_map}
+        else:
+            self._validator_map = VALIDATOR_MAP
 
     def extract_content_type(
         self, headers: t.List[t.Tuple[bytes, bytes]]
@@ -163,10 +163,15 @@ def starlettify_path(swagger_path, types=None):
     >>> starlettify_path('/foo/{someint}', {'someint': 'int'})
     '/foo/{someint:int}'
     """
-    if types is None:
-        types = {}
-    convert_match = functools.partial(convert_path_parameter, types=types)
-    return PATH_PARAMETER.sub(convert_match, swagger_path)
+    return _starlettify_path(swagger_path, frozenset((types or {}).items()))
+
+
+@functools.lru_cache(maxsize=None)
+def _starlettify_path(swagger_path: str, types: t.FrozenSet[t.Tuple[str, str]]) -> str:
+    types_dict = dict(types)
+    return PATH_PARAMETER.sub(
+        lambda match: convert_path_parameter(match, types_dict), swagger_path
+    )
 
 
 class FloatConverter(starlette.convertors.FloatConvertor):
@@ -34,6 +34,8 @@ install_requires = [
 
 swagger_ui_require = 'swagger-ui-bundle>=0.0.2,<0.1'
 
+orjson_require = 'orjson>=3,<4'
+
 flask_require = [
     'flask[async]>=2.2,<3',
     'a2wsgi>=1.4,<2',
@@ -45,7 +47,8 @@ tests_require = [
     'pre-commit>=2,<3',
     'pytest-cov>=2,<3',
     *flask_require,
-    swagger_ui_require
+    swagger_ui_require,
+    orjson_require,
 ]
 
 docs_require = [
@@ -104,6 +107,7 @@ setup(
         'tests': tests_require,
         'flask': flask_require,
         'swagger-ui': swagger_ui_require,
+        'orjson': orjson_require,
         'docs': docs_require,
         'uvicorn': uvicorn_requires,
     },
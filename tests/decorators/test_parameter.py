@@ -1,6 +1,23 @@
-from unittest.mock import MagicMock
-
-from connexion.decorators.parameter import parameter_to_arg, pythonic
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from connexion.decorators import parameter
+from connexion.decorators.parameter import (
+    _SIG_CACHE,
+    _copy_defaults,
+    _FormSchema,
+    _get_body_argument_form,
+    _get_file_arguments,
+    _get_form_schema,
+    _get_mutable_keys,
+    _get_param_type,
+    _get_param_types,
+    get_starlette_body,
+    inspect_function_arguments,
+    parameter_to_arg,
+    pythonic,
+    sanitized,
+)
 
 
 async def test_injection():
@@ -33,6 +50,8 @@ async def test_injection():
     parameter_decorator = parameter_to_arg(Op(), handler)
     parameter_decorator(request)
     func.assert_called_with(p1="123")
+    # GET requests have no body to pass to the handler
+    request.get_json.assert_not_called()
 
 
 async def test_injection_with_context():
@@ -68,3 +87,133 @@ async def test_injection_with_context():
 def test_pythonic_params():
     assert pythonic("orderBy[eq]") == "order_by_eq"
     assert pythonic("ids[]") == "ids"
+    assert pythonic("filter") == "filter_"
+    assert pythonic("lambda") == "lambda_"
+
+
+def test_sanitized():
+    assert sanitized("") == ""
+    assert sanitized("orderBy[eq]") == "orderBy_eq"
+    assert sanitized("ids[]") == "ids"
+    assert sanitized("a[]b[c]") == "ab_c"
+    assert sanitized("1-foo.bar") == "foobar"
+
+
+def test_inspect_function_arguments_cached():
+    def handler(a, b, *args, c=None, **kwargs):
+        pass
+
+    arguments, has_kwargs = inspect_function_arguments(handler)
+    assert arguments == {"a", "b", "c"}
+    assert has_kwargs
+    assert inspect_function_arguments(handler) is _SIG_CACHE[handler]
+
+
+def test_copy_defaults():
+    defaults = {"limit": 10, "tags": ["a", "b"], "filter": {"name": "x"}}
+    mutable_keys = _get_mutable_keys(defaults)
+    assert mutable_keys == ("tags", "filter")
+
+    copied = _copy_defaults(defaults, mutable_keys)
+    assert copied == defaults
+    copied["tags"].append("c")
+    copied["filter"]["name"] = "y"
+    assert defaults == {"limit": 10, "tags": ["a", "b"], "filter": {"name": "x"}}
+
+
+def test_file_arguments_sanitized():
+    files = {"uploadFile": "a", "other[]": "b"}
+    assert _get_file_arguments(files, {"other"}) == {"other": "b"}
+    assert _get_file_arguments(files, frozenset(), has_kwargs=True) == {
+        "uploadFile": "a",
+        "other": "b",
+    }
+    assert _get_file_arguments(files, {"upload_file"}, sanitize=pythonic) == {
+        "upload_file": "a"
+    }
+
+
+@pytest.mark.parametrize("orjson", [parameter.orjson, None])
+async def test_get_starlette_body_json(monkeypatch, orjson):
+    monkeypatch.setattr(parameter, "orjson", orjson)
+    request = MagicMock(name="request")
+    request.content_type = "application/json"
+    request.body = AsyncMock()
+
+    request.body.return_value = b'{"a": 1, "b": [true, null]}'
+    assert await get_starlette_body(request) == {"a": 1, "b": [True, None]}
+
+    request.body.return_value = b'{"big": 123456789012345678901234567890}'
+    assert await get_starlette_body(request) == {"big": 123456789012345678901234567890}
+
+    request.body.return_value = b'{"small": -9999999999999999999}'
+    assert await get_starlette_body(request) == {"small": -9999999999999999999}
+
+    request.body.return_value = b""
+    assert await get_starlette_body(request) is None
+
+    request.body.return_value = b"{invalid"
+    with pytest.raises(ValueError):
+        await get_starlette_body(request)
+
+
+def test_body_argument_form_defaults():
+    default_body = {"name": "x", "tags": ["a"]}
+    body_types = _get_param_types(
+        {
+            "name": {"schema": {"type": "string"}},
+            "tags": {"schema": {"type": "array", "items": {"type": "string"}}},
+        }
+    )
+    form_schema = _FormSchema(
+        default_body, _get_mutable_keys(default_body), body_types, True
+    )
+
+    assert _get_body_argument_form(None, form_schema=form_schema) == default_body
+    assert _get_body_argument_form({"name": "y"}, form_schema=form_schema) == {
+        "name": "y",
+        "tags": ["a"],
+    }
+    body = {"name": "y", "tags": ["b"], "extra": "z"}
+    assert _get_body_argument_form(body, form_schema=form_schema) == body
+    assert default_body == {"name": "x", "tags": ["a"]}
+
+
+def test_form_schema_untyped_properties():
+    class Op:
+        def body_schema(self, *args, **kwargs):
+            return {
+                "properties": {
+                    "anything": {},
+                    "n": {"type": "integer"},
+                    "items": {"type": "array", "items": {}},
+                },
+                "additionalProperties": False,
+            }
+
+    form_schema = _get_form_schema(Op(), "application/x-www-form-urlencoded")
+    body = {"anything": "x", "n": "3", "items": ["1", 2]}
+    assert _get_body_argument_form(body, form_schema=form_schema) == {
+        "anything": "x",
+        "n": 3,
+        "items": ["1", 2],
+    }
+
+
+def test_param_type():
+    param_type = _get_param_type({"in": "query", "type": "integer"})
+    assert (param_type.nullable, param_type.is_array) == (False, False)
+    assert param_type.caster("1") == 1
+
+    param_type = _get_param_type(
+        {
+            "in": "query",
+            "schema": {
+                "type": "array",
+                "nullable": True,
+                "items": {"type": "number"},
+            },
+        }
+    )
+    assert (param_type.nullable, param_type.is_array) == (True, True)
+    assert param_type.caster("1.5") == 1.5